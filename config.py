@@ -42,6 +42,11 @@ OUTPUT_DIR = Path("output")
 # articles on subsequent runs.
 STATE_FILE = Path("state.json")
 
+# Path to the Bloom filter of already processed articles.  It holds hashes of
+# article links and texts so stories republished across several feeds are
+# only summarised and synthesised once.
+SEEN_FILE = Path("seen.bloom")
+
 # How often to run the job when scheduling is enabled (in minutes).  For
 # example, setting this to 60 will run the agent once every hour when
 # executing `python main.py --schedule`.
@@ -3,6 +3,6 @@
 Exposes convenience functions to run the pipeline programmatically.
 """
 
-from .producer import run_once, schedule_run
+from .producer import run_once, run_once_async, schedule_run, schedule_run_async
 
-__all__ = ["run_once", "schedule_run"]
\ No newline at end of file
+__all__ = ["run_once", "run_once_async", "schedule_run", "schedule_run_async"]
\ No newline at end of file
@@ -10,12 +10,15 @@ when the optional packages are present.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import datetime
+import io
 import json
 import logging
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import feedparser  # type: ignore
@@ -28,17 +31,87 @@ except ImportError:
     Article = None  # type: ignore
 
 try:
-    from bs4 import BeautifulSoup  # type: ignore
+    from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
 except ImportError:
     BeautifulSoup = None  # type: ignore
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None  # type: ignore
+
+try:
+    from lxml import etree  # type: ignore
+except ImportError:
+    etree = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Common headers to avoid bot detection
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+_FEED_HEADERS = {
+    **_DEFAULT_HEADERS,
+    'Accept': 'application/rss+xml,application/xml,text/xml;q=0.9,*/*;q=0.8',
+}
+
+_ARTICLE_HEADERS = {
+    **_DEFAULT_HEADERS,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Shared session for the blocking code paths so feeds and articles hosted on
+# the same site reuse pooled keep-alive connections instead of performing a
+# new TCP/TLS handshake for every request.
+_SESSION = None
+if requests:
+    _SESSION = requests.Session()
+    _SESSION.headers.update(_DEFAULT_HEADERS)
+    _adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    _SESSION.mount("https://", _adapter)
+    _SESSION.mount("http://", _adapter)
+
+# Patterns used by the regular expression fallback parser
+_ITEM_RE = re.compile(r"<item\b[^>]*>(.*?)</item>", re.DOTALL | re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.DOTALL | re.IGNORECASE)
+_LINK_RE = re.compile(r"<link>(.*?)</link>", re.DOTALL | re.IGNORECASE)
+_PUB_RE = re.compile(
+    r"<(?:pubDate|updated|dc:date)>(.*?)</(?:pubDate|updated|dc:date)>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+# RSS 1.0 (RDF) items and their Dublin Core dates
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+# Elements parsed into entries by the lxml based parsers
+_FEED_ITEM_TAGS = ("item", f"{_RSS1_NS}item", f"{_ATOM_NS}entry")
+
+# Size of the chunks in which `aiohttp` feed bodies are handed to lxml
+_FEED_CHUNK_BYTES = 64 * 1024
+
+# BeautifulSoup backend for article pages: the C‑based lxml parser when
+# installed, the pure Python built‑in parser otherwise.
+_HTML_PARSER = "lxml" if etree is not None else "html.parser"
+
 
 @dataclass
 class FeedEntry:
@@ -47,92 +120,420 @@ class FeedEntry:
     published: datetime.datetime
 
 
-def parse_rss_feed(url: str) -> List[FeedEntry]:
-    """Parse an RSS/Atom feed and return a list of entries.
+def _parse_pub_date(pub_str: Optional[str]) -> datetime.datetime:
+    """Parse an RSS `pubDate` or Atom `updated` value.
 
-    If the `feedparser` library is available it will be used.  Otherwise a
-    lightweight regular expression–based parser will be employed.  The
-    resulting entries contain the article title, link and published
-    timestamp.
+    :param pub_str: Date string from the feed, or None.
+    :returns: Timezone‑aware datetime; the current time if parsing fails.
+    """
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    if not pub_str:
+        return now
+    pub_str = pub_str.strip()
+    try:
+        return datetime.datetime.strptime(pub_str, "%a, %d %b %Y %H:%M:%S %Z").replace(
+            tzinfo=datetime.timezone.utc
+        )
+    except ValueError:
+        pass
+    try:
+        # Atom feeds use ISO 8601 timestamps
+        published = datetime.datetime.fromisoformat(pub_str)
+    except ValueError:
+        return now
+    return published if published.tzinfo else published.replace(tzinfo=datetime.timezone.utc)
 
-    :param url: URL to the feed.
-    :returns: List of FeedEntry objects sorted by publication date (newest first).
+
+def _entries_from_feedparser(feed) -> List[FeedEntry]:
+    """Convert a parsed `feedparser` result into a list of entries.
+
+    :param feed: Object returned by `feedparser.parse`.
+    :returns: List of FeedEntry objects in feed order.
     """
     entries: List[FeedEntry] = []
+    for entry in feed.entries:
+        # Attempt to parse publication date; fall back to current time if missing.
+        try:
+            published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            if published_parsed:
+                published = datetime.datetime.fromtimestamp(
+                    datetime.datetime(*published_parsed[:6]).timestamp(), tz=datetime.timezone.utc
+                )
+            else:
+                published = datetime.datetime.now(tz=datetime.timezone.utc)
+        except Exception:
+            published = datetime.datetime.now(tz=datetime.timezone.utc)
+
+        entries.append(
+            FeedEntry(
+                title=str(entry.get("title", "")),
+                link=str(entry.get("link", "")),
+                published=published,
+            )
+        )
+    return entries
+
+
+def _entries_from_xml(content: str) -> List[FeedEntry]:
+    """Extract entries from raw feed XML using regular expressions.
+
+    :param content: Feed document as text.
+    :returns: List of FeedEntry objects in feed order.
+    """
+    entries: List[FeedEntry] = []
+    # Extract items
+    for item in _ITEM_RE.findall(content):
+        title_match = _TITLE_RE.search(item)
+        link_match = _LINK_RE.search(item)
+        pub_match = _PUB_RE.search(item)
+        title = title_match.group(1).strip() if title_match else ""
+        link = link_match.group(1).strip() if link_match else ""
+        pub_str = pub_match.group(1).strip() if pub_match else None
+        published = _parse_pub_date(pub_str)
+        if link:
+            entries.append(FeedEntry(title=title, link=link, published=published))
+    return entries
+
+
+def _entry_from_element(elem) -> Optional[FeedEntry]:
+    """Convert a parsed RSS item or Atom entry element and free it.
+
+    The element and any already processed siblings are cleared afterwards,
+    so memory use stays bounded while the rest of the document is parsed.
+
+    :param elem: An element matching `_FEED_ITEM_TAGS`.
+    :returns: A FeedEntry, or None if the element has no link.
+    """
+    if elem.tag == "item":
+        title = elem.findtext("title") or ""
+        link = elem.findtext("link") or ""
+        pub_str = elem.findtext("pubDate") or elem.findtext(f"{_DC_NS}date")
+    elif elem.tag == f"{_RSS1_NS}item":
+        title = elem.findtext(f"{_RSS1_NS}title") or ""
+        link = elem.findtext(f"{_RSS1_NS}link") or ""
+        pub_str = elem.findtext(f"{_DC_NS}date")
+    else:
+        title = elem.findtext(f"{_ATOM_NS}title") or ""
+        link_elem = elem.find(f"{_ATOM_NS}link")
+        link = link_elem.get("href", "") if link_elem is not None else ""
+        pub_str = elem.findtext(f"{_ATOM_NS}updated") or elem.findtext(f"{_ATOM_NS}published")
+    # Free the parsed element and any already processed siblings
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+    link = link.strip()
+    if not link:
+        return None
+    return FeedEntry(title=title.strip(), link=link, published=_parse_pub_date(pub_str))
+
+
+def _entries_from_events(events: Iterable[Tuple[str, Any]]) -> Iterator[FeedEntry]:
+    """Yield the entries of `(event, element)` pairs reported by lxml.
+
+    :param events: End events of elements matching `_FEED_ITEM_TAGS`.
+    :returns: Iterator over the FeedEntry objects, in feed order.
+    """
+    for _, elem in events:
+        entry = _entry_from_element(elem)
+        if entry is not None:
+            yield entry
+
+
+def _entries_from_stream(stream) -> List[FeedEntry]:
+    """Extract entries from a feed document with `lxml.etree.iterparse`.
+
+    Each RSS 2.0 or RSS 1.0 (RDF) `<item>` and each Atom `<entry>` is
+    converted as soon as its closing tag has been read and then discarded,
+    so memory use stays bounded.  The whole document is always read: feeds
+    are not guaranteed to list entries newest first, so truncation is left
+    to `_newest`.
+
+    :param stream: Binary file‑like object with the feed document.
+    :returns: List of FeedEntry objects in feed order.
+    """
+    entries: List[FeedEntry] = []
+    try:
+        events = etree.iterparse(stream, events=("end",), tag=_FEED_ITEM_TAGS, recover=True)
+        for entry in _entries_from_events(events):
+            entries.append(entry)
+    except etree.XMLSyntaxError as exc:
+        logger.warning("Malformed feed document: %s", exc)
+    return entries
+
+
+async def _entries_from_response(resp) -> List[FeedEntry]:
+    """Extract entries from an `aiohttp` feed response while it arrives.
+
+    The body is fed to an `lxml.etree.XMLPullParser` chunk by chunk, so like
+    `_entries_from_stream` only the entry being parsed is held in memory.
+
+    :param resp: An `aiohttp.ClientResponse` whose body has not been read.
+    :returns: List of FeedEntry objects in feed order.
+    """
+    parser = etree.XMLPullParser(events=("end",), tag=_FEED_ITEM_TAGS, recover=True)
+    entries: List[FeedEntry] = []
+    try:
+        async for chunk in resp.content.iter_chunked(_FEED_CHUNK_BYTES):
+            parser.feed(chunk)
+            entries.extend(_entries_from_events(parser.read_events()))
+        parser.close()
+    except etree.XMLSyntaxError as exc:
+        logger.warning("Malformed feed document: %s", exc)
+    entries.extend(_entries_from_events(parser.read_events()))
+    return entries
+
+
+def _newest(entries: List[FeedEntry], max_entries: Optional[int] = None) -> List[FeedEntry]:
+    """Sort entries newest first, keeping at most `max_entries` of them.
+
+    :param entries: Parsed feed entries in any order.
+    :param max_entries: Number of entries to keep (None for all).
+    :returns: List of FeedEntry objects sorted by publication date (newest first).
+    """
+    return sorted(entries, key=lambda e: e.published, reverse=True)[:max_entries]
+
+
+def _parse_feed_content(content: bytes, max_entries: Optional[int] = None) -> List[FeedEntry]:
+    """Parse an already downloaded RSS/Atom document.
+
+    Uses `feedparser` when installed, `lxml` when available and the regular
+    expression fallback otherwise.  No network access is performed.
+
+    :param content: Raw feed document.
+    :param max_entries: Only return the newest this many entries (None for all).
+    :returns: List of FeedEntry objects sorted by publication date (newest first).
+    """
+    if feedparser:
+        entries = _entries_from_feedparser(feedparser.parse(content))
+    elif etree is not None:
+        entries = _entries_from_stream(io.BytesIO(content))
+    else:
+        entries = _entries_from_xml(content.decode("utf-8", errors="replace"))
+    return _newest(entries, max_entries)
+
+
+def _conditional_headers(feed_state: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Build request headers for a conditional GET of a feed.
+
+    :param feed_state: Cached validators for the feed, or None.
+    :returns: Feed request headers including `If-None-Match` and
+        `If-Modified-Since` when validators are known.
+    """
+    headers = dict(_FEED_HEADERS)
+    if feed_state:
+        if feed_state.get("etag"):
+            headers["If-None-Match"] = feed_state["etag"]
+        if feed_state.get("modified"):
+            headers["If-Modified-Since"] = feed_state["modified"]
+    return headers
+
+
+def _store_validators(
+    feed_state: Optional[Dict[str, Any]], etag: Optional[str], modified: Optional[str]
+) -> None:
+    """Remember the validators returned by the server for the next run.
+
+    :param feed_state: Mutable mapping to update, or None to do nothing.
+    :param etag: Value of the `ETag` response header.
+    :param modified: Value of the `Last-Modified` response header.
+    """
+    if feed_state is None:
+        return
+    if etag:
+        feed_state["etag"] = etag
+    if modified:
+        feed_state["modified"] = modified
+
+
+def parse_rss_feed(
+    url: str,
+    feed_state: Optional[Dict[str, Any]] = None,
+    max_entries: Optional[int] = None,
+) -> List[FeedEntry]:
+    """Parse an RSS/Atom feed and return a list of entries.
+
+    If the `feedparser` library is available it will be used.  Otherwise the
+    response is streamed through `lxml.etree.iterparse`, or, if `lxml` is
+    not installed either, a lightweight regular expression–based parser will
+    be employed.  The resulting entries contain the article title, link and
+    published timestamp.
 
-    # Common headers to avoid bot detection
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/rss+xml,application/xml,text/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-    }
+    When `feed_state` holds an `etag` or `modified` value from a previous
+    run, a conditional request is made; if the server reports the feed as
+    unchanged (HTTP 304) no entries are returned.
 
+    :param url: URL to the feed.
+    :param feed_state: Optional mutable mapping with the feed's cached `etag`
+        and `modified` validators.  Updated in place from the response.
+    :param max_entries: Only return the newest this many entries of the feed
+        (None for all).
+    :returns: List of FeedEntry objects sorted by publication date (newest first).
+    """
+    etag = feed_state.get("etag") if feed_state else None
+    modified = feed_state.get("modified") if feed_state else None
     # Use feedparser if installed for robust parsing.
     if feedparser:
         logger.debug("Fetching feed %s using feedparser", url)
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
-            # Attempt to parse publication date; fall back to current time if missing.
-            try:
-                published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
-                if published_parsed:
-                    published = datetime.datetime.fromtimestamp(
-                        datetime.datetime(*published_parsed[:6]).timestamp(), tz=datetime.timezone.utc
-                    )
-                else:
-                    published = datetime.datetime.now(tz=datetime.timezone.utc)
-            except Exception:
-                published = datetime.datetime.now(tz=datetime.timezone.utc)
-
-            entries.append(
-                FeedEntry(
-                    title=str(entry.get("title", "")),
-                    link=str(entry.get("link", "")),
-                    published=published,
-                )
-            )
+        feed = feedparser.parse(url, etag=etag, modified=modified)
+        if feed.get("status") == 304:
+            logger.info("Feed %s not modified since last run", url)
+            return []
+        _store_validators(feed_state, feed.get("etag"), feed.get("modified"))
+        entries = _entries_from_feedparser(feed)
     else:
-        # Fallback: simple regex to extract <item> or <entry> elements.
-        logger.debug("Fetching feed %s using regex fallback", url)
+        # Fallback: stream through lxml, or use a simple regex to extract
+        # <item> elements.
+        logger.debug("Fetching feed %s using %s fallback", url, "lxml" if etree else "regex")
         if not requests:
             logger.error("requests library not available; cannot fetch feeds")
             return []
         try:
-            resp = requests.get(url, timeout=10, headers=headers)
+            resp = _SESSION.get(
+                url, timeout=10, headers=_conditional_headers(feed_state), stream=True
+            )
             resp.raise_for_status()
         except Exception as exc:
             logger.error("Failed to fetch feed %s: %s", url, exc)
             return []
-        content = resp.text
-        # Extract items
-        item_pattern = re.compile(
-            r"<item>(.*?)</item>", re.DOTALL | re.IGNORECASE
-        )
-        entries_raw = item_pattern.findall(content)
-        for item in entries_raw:
-            title_match = re.search(r"<title>(.*?)</title>", item, re.DOTALL | re.IGNORECASE)
-            link_match = re.search(r"<link>(.*?)</link>", item, re.DOTALL | re.IGNORECASE)
-            pub_match = re.search(
-                r"<(?:pubDate|updated)>(.*?)</(?:pubDate|updated)>", item, re.DOTALL | re.IGNORECASE
-            )
-            title = title_match.group(1).strip() if title_match else ""
-            link = link_match.group(1).strip() if link_match else ""
-            pub_str = pub_match.group(1).strip() if pub_match else None
+        with resp:
+            if resp.status_code == 304:
+                logger.info("Feed %s not modified since last run", url)
+                return []
+            # The body is only read while parsing, so a connection dropped
+            # part way through surfaces here rather than in `get`
             try:
-                published = (
-                    datetime.datetime.strptime(pub_str, "%a, %d %b %Y %H:%M:%S %Z")
-                    if pub_str
-                    else datetime.datetime.now(tz=datetime.timezone.utc)
-                )
-            except Exception:
-                published = datetime.datetime.now(tz=datetime.timezone.utc)
-            if link:
-                entries.append(FeedEntry(title=title, link=link, published=published))
+                if etree is not None:
+                    # Let urllib3 undo any gzip/deflate content encoding
+                    resp.raw.decode_content = True
+                    entries = _entries_from_stream(resp.raw)
+                else:
+                    entries = _entries_from_xml(resp.text)
+            except Exception as exc:
+                logger.error("Failed to fetch feed %s: %s", url, exc)
+                return []
+            _store_validators(
+                feed_state, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            )
 
     # Sort newest first
-    return sorted(entries, key=lambda e: e.published, reverse=True)
+    return _newest(entries, max_entries)
+
+
+def open_session():
+    """Return an async context manager yielding a shared HTTP session.
+
+    When `aiohttp` is installed the session is an `aiohttp.ClientSession`
+    whose connector allows up to 16 simultaneous connections.  Otherwise the
+    context manager yields None and the async helpers below fall back to
+    running the blocking functions in worker threads.
+    """
+    if aiohttp is None:
+        return contextlib.nullcontext(None)
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16))
+
+
+async def _fetch_feed(
+    session,
+    url: str,
+    feed_state: Optional[Dict[str, Any]] = None,
+    max_entries: Optional[int] = None,
+) -> List[FeedEntry]:
+    """Download a feed with `aiohttp` and parse it.
+
+    Without `feedparser`, the body is parsed with lxml while it downloads
+    (see `_entries_from_response`).  `feedparser` and the regular expression
+    fallback need the whole document, so with them it is read first.
+
+    :param session: An `aiohttp.ClientSession`.
+    :param url: URL to the feed.
+    :param feed_state: Optional mutable mapping with cached validators; see
+        `parse_rss_feed`.
+    :param max_entries: Only return the newest this many entries (None for all).
+    :returns: List of FeedEntry objects sorted by publication date (newest first).
+    """
+    logger.debug("Fetching feed %s using aiohttp", url)
+    try:
+        async with session.get(
+            url,
+            headers=_conditional_headers(feed_state),
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            resp.raise_for_status()
+            if resp.status == 304:
+                logger.info("Feed %s not modified since last run", url)
+                return []
+            if feedparser is None and etree is not None:
+                entries = _newest(await _entries_from_response(resp), max_entries)
+            else:
+                entries = _parse_feed_content(await resp.read(), max_entries)
+            _store_validators(feed_state, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+    except Exception as exc:
+        logger.error("Failed to fetch feed %s: %s", url, exc)
+        return []
+    return entries
+
+
+async def fetch_feed(
+    session,
+    url: str,
+    feed_state: Optional[Dict[str, Any]] = None,
+    max_entries: Optional[int] = None,
+) -> List[FeedEntry]:
+    """Asynchronously fetch and parse a feed.
+
+    :param session: Session yielded by `open_session`, or None when `aiohttp`
+        is unavailable, in which case `parse_rss_feed` runs in a worker thread.
+    :param url: URL to the feed.
+    :param feed_state: Optional mutable mapping with cached validators; see
+        `parse_rss_feed`.
+    :param max_entries: Only return the newest this many entries (None for all).
+    :returns: List of FeedEntry objects sorted by publication date (newest first).
+    """
+    if session is None:
+        return await asyncio.to_thread(parse_rss_feed, url, feed_state, max_entries)
+    return await _fetch_feed(session, url, feed_state, max_entries)
+
+
+def _extract_paragraphs(html: str) -> Optional[str]:
+    """Extract the text of all `<p>` tags from an HTML document.
+
+    :param html: Raw HTML of the article page.
+    :returns: Newline‑separated paragraph text or None if nothing was found.
+    """
+    # Only build the tree for <p> elements; everything else is discarded
+    soup = BeautifulSoup(html, _HTML_PARSER, parse_only=SoupStrainer("p"))
+    # Extract text from paragraph tags
+    paragraphs = [p.get_text().strip() for p in soup.find_all("p") if p.get_text().strip()]
+    if not paragraphs:
+        return None
+    return "\n".join(paragraphs)
+
+
+def _extract(html: str, url: str) -> Optional[str]:
+    """Extract the main text from an already downloaded article page.
+
+    Uses `newspaper3k` on the supplied HTML when available and falls back to
+    collecting `<p>` tags with `BeautifulSoup`.  No network access is
+    performed.
+
+    :param html: Raw HTML of the article page.
+    :param url: Article URL (used by newspaper and for log messages).
+    :returns: Plain text of the article or None if extraction fails.
+    """
+    if Article is not None:
+        try:
+            art = Article(url)
+            art.download(input_html=html)
+            art.parse()
+            text = art.text
+            if text:
+                return text.strip()
+        except Exception as exc:
+            logger.warning("newspaper failed for %s: %s", url, exc)
+    if not BeautifulSoup:
+        logger.error("Cannot extract article %s: BeautifulSoup not available", url)
+        return None
+    return _extract_paragraphs(html)
 
 
 def fetch_article_text(url: str) -> Optional[str]:
@@ -147,17 +548,7 @@ def fetch_article_text(url: str) -> Optional[str]:
     :returns: Plain text of the article or None if extraction fails.
     """
     logger.debug("Fetching article %s", url)
-    
-    # Common headers to avoid bot detection
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-    
+
     # Try to use newspaper if installed
     if Article is not None:
         try:
@@ -180,15 +571,48 @@ def fetch_article_text(url: str) -> Optional[str]:
         )
         return None
     try:
-        resp = requests.get(url, timeout=10, headers=headers)
+        resp = _SESSION.get(url, timeout=10, headers=_ARTICLE_HEADERS)
         resp.raise_for_status()
     except Exception as exc:
         logger.error("Failed to download article %s: %s", url, exc)
         return None
-    html = resp.text
-    soup = BeautifulSoup(html, "html.parser")
-    # Extract text from paragraph tags
-    paragraphs = [p.get_text().strip() for p in soup.find_all("p") if p.get_text().strip()]
-    if not paragraphs:
+    return _extract_paragraphs(resp.text)
+
+
+async def _download(session, url: str) -> Optional[str]:
+    """Download an article page with `aiohttp`.
+
+    :param session: An `aiohttp.ClientSession`.
+    :param url: Article URL.
+    :returns: Raw HTML or None if the download fails.
+    """
+    logger.debug("Fetching article %s", url)
+    try:
+        async with session.get(
+            url, headers=_ARTICLE_HEADERS, timeout=aiohttp.ClientTimeout(total=10)
+        ) as resp:
+            resp.raise_for_status()
+            return await resp.text()
+    except Exception as exc:
+        logger.error("Failed to download article %s: %s", url, exc)
+        return None
+
+
+async def fetch_article(session, url: str) -> Optional[str]:
+    """Asynchronously download and extract the main text of an article.
+
+    The download runs on the event loop; extraction is CPU bound and runs in
+    a worker thread so it does not hold up other downloads.
+
+    :param session: Session yielded by `open_session`, or None when `aiohttp`
+        is unavailable, in which case `fetch_article_text` runs in a worker
+        thread.
+    :param url: Article URL.
+    :returns: Plain text of the article or None if extraction fails.
+    """
+    if session is None:
+        return await asyncio.to_thread(fetch_article_text, url)
+    html = await _download(session, url)
+    if html is None:
         return None
-    return "\n".join(paragraphs)
\ No newline at end of file
+    return await asyncio.to_thread(_extract, html, url)
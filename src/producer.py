@@ -3,26 +3,40 @@
 This module coordinates the fetching of feeds and articles, summarisation and
 text‑to‑speech generation.  It provides two entry points:
 
-* `run_once()`: processes all configured feeds one time.
-* `schedule_run()`: schedules `run_once` to run at a regular interval.
+* `run_once()`: processes all configured feeds one time (`run_once_async()`
+  does the same on an already running event loop).
+* `schedule_run()`: schedules the pipeline to run at a regular interval
+  (`schedule_run_async()` is its coroutine counterpart).
 
-The state of the last processed article per feed is persisted between runs
-using a JSON file.  If the state file does not exist, all articles in the
+The state of the last processed article per feed, together with the HTTP
+cache validators (`ETag`/`Last-Modified`) of each feed, is persisted between
+runs using a JSON file.  If the state file does not exist, all articles in the
 feeds will be considered new on the first run.
+
+Articles that appear in several feeds are only processed once: the SHA‑256
+hashes of processed article links and texts are kept in a Bloom filter that
+is persisted next to the state file.
 """
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import re
-import time
 
-import schedule
+try:
+    from pybloom_live import ScalableBloomFilter  # type: ignore
+except ImportError:
+    ScalableBloomFilter = None  # type: ignore
 
 from config import (
     FEED_URLS,
@@ -30,72 +44,210 @@ from config import (
     MAX_SUMMARY_SENTENCES,
     OUTPUT_DIR,
     RUN_EVERY_MINUTES,
+    SEEN_FILE,
     STATE_FILE,
     TTS_ENGINE,
     TTS_LANGUAGE,
 )
-from .fetcher import FeedEntry, fetch_article_text, parse_rss_feed
+from .fetcher import FeedEntry, fetch_article, fetch_feed, open_session
 from .summariser import summarise
 from .tts import get_tts_engine
 
 logger = logging.getLogger(__name__)
 
+# Number of concurrent article downloads.
+_FETCH_WORKERS = 8
+
+# Number of concurrent speech synthesis calls.
+_TTS_WORKERS = 4
 
-def _load_state(path: Path) -> Dict[str, float]:
+
+def _load_state(path: Path) -> Dict[str, Dict[str, Any]]:
     """Load the persisted state from disk.
 
-    The state maps feed URLs to the UNIX timestamp of the most recent
-    processed article.  If the state file is missing or malformed, an empty
-    dictionary is returned.
+    The state maps feed URLs to a dictionary holding the UNIX timestamp of
+    the most recent processed article (`ts`) and the feed's last `etag` and
+    `modified` validators.  State files written by older versions, which map
+    feed URLs directly to timestamps, are upgraded on load.  If the state
+    file is missing or malformed, an empty dictionary is returned.
 
     :param path: Path to the JSON file.
-    :returns: Mapping of feed URL to timestamp.
+    :returns: Mapping of feed URL to feed state.
     """
     if not path.exists():
         return {}
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
-        # Ensure keys are strings and values are floats
-        return {str(k): float(v) for k, v in data.items()}
+        state: Dict[str, Dict[str, Any]] = {}
+        for url, value in data.items():
+            if not isinstance(value, dict):
+                value = {"ts": value}
+            feed_state: Dict[str, Any] = {"ts": float(value.get("ts", 0.0))}
+            for key in ("etag", "modified"):
+                if value.get(key):
+                    feed_state[key] = str(value[key])
+            state[str(url)] = feed_state
+        return state
     except Exception as exc:
         logger.warning("Failed to load state from %s: %s", path, exc)
         return {}
 
 
-def _save_state(state: Dict[str, float], path: Path) -> None:
+def _checkpoint(state: Dict[str, Dict[str, Any]], path: Path) -> None:
     """Persist the state dictionary to disk.
 
-    :param state: Mapping of feed URL to timestamp.
+    The state is written to a temporary file which then atomically replaces
+    `path`, so a crash mid‑write never leaves a truncated state file.  This
+    is called after every processed article, so progress survives a crash
+    part way through a run.
+
+    :param state: Mapping of feed URL to feed state.
     :param path: Path to write the JSON file to.
     """
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(state), encoding="utf-8")
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(state, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
     except Exception as exc:
         logger.error("Failed to save state to %s: %s", path, exc)
 
 
-def _process_entry(
-    entry: FeedEntry,
-    summary_dir: Path,
-    tts_fn,
+def _load_seen(path: Path):
+    """Load the filter of article hashes processed on previous runs.
+
+    Uses a `pybloom_live.ScalableBloomFilter` so memory stays bounded however
+    many articles have been seen.  If `pybloom-live` is not installed, an
+    empty set is returned instead; duplicates are then only detected within
+    a single run.
+
+    :param path: Path to the serialised Bloom filter.
+    :returns: A container supporting `in` and `add`.
+    """
+    if ScalableBloomFilter is None:
+        logger.debug("pybloom-live not available; deduplicating within this run only")
+        return set()
+    if path.exists():
+        try:
+            with path.open("rb") as fh:
+                return ScalableBloomFilter.fromfile(fh)
+        except Exception as exc:
+            logger.warning("Failed to load seen articles from %s: %s", path, exc)
+    return ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+
+
+def _save_seen(seen, path: Path) -> None:
+    """Persist the filter of processed article hashes to disk.
+
+    Like the state file, the filter is written to a temporary file which
+    then atomically replaces `path`.  It is saved together with every state
+    checkpoint, so the two stay consistent after a crash.  Nothing is written
+    when the in‑memory set fallback is in use.
+
+    :param seen: Filter returned by `_load_seen`.
+    :param path: Path to write the serialised Bloom filter to.
+    """
+    if ScalableBloomFilter is None or not isinstance(seen, ScalableBloomFilter):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".bloom.tmp")
+        with tmp_path.open("wb") as fh:
+            seen.tofile(fh)
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        logger.error("Failed to save seen articles to %s: %s", path, exc)
+
+
+def _digest(value: str) -> str:
+    """Return the SHA‑256 hex digest of a string."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _claim(digest: str, seen, claimed: Set[str]) -> bool:
+    """Reserve an article hash for processing in this run.
+
+    :param digest: Hash of the article link or text.
+    :param seen: Filter of hashes processed on previous runs.
+    :param claimed: Hashes already reserved during this run.
+    :returns: False if the article is a duplicate and should be skipped.
+    """
+    if digest in seen or digest in claimed:
+        return False
+    claimed.add(digest)
+    return True
+
+
+@dataclass
+class _PendingFeed:
+    """Progress of a fetched feed's selected entries during a run."""
+
+    validators: Dict[str, str]
+    entries: List[FeedEntry]
+    # Outcome of each finished entry by link: True if done, False if failed
+    outcomes: Dict[str, bool] = field(default_factory=dict)
+
+
+def _entry_done(
     feed_url: str,
-    state: Dict[str, float],
-) -> Optional[float]:
-    """Process a single feed entry: fetch, summarise, synthesise.
+    entry: FeedEntry,
+    ok: bool,
+    state: Dict[str, Dict[str, Any]],
+    pending: Dict[str, _PendingFeed],
+) -> None:
+    """Record that one selected entry of a feed has been handled.
+
+    The feed's `ts` only advances up to, but not including, the publication
+    time of its oldest entry that is still in flight or has failed, so that
+    entry is selected again on the next run.  Newer entries that already
+    succeeded are then skipped through the `seen` filter.
+
+    Once every selected entry of the feed has been synthesised or
+    deliberately skipped, the feed's new validators are copied into `state`.
+    If any entry failed they are dropped, so the next run fetches the feed in
+    full instead of receiving a 304 and never retrying the failed articles.
 
-    :param entry: The feed entry to process.
+    :param feed_url: URL of the feed the entry belongs to.
+    :param entry: The entry that has been handled.
+    :param ok: False if the entry failed and should be retried next run.
+    :param state: Mapping of feed URL to feed state; updated in place.
+    :param pending: Feeds with outstanding entries; updated in place.
+    """
+    feed = pending[feed_url]
+    feed.outcomes[entry.link] = ok
+    blocked = min(
+        (e.published.timestamp() for e in feed.entries if not feed.outcomes.get(e.link)),
+        default=float("inf"),
+    )
+    done = [
+        e.published.timestamp()
+        for e in feed.entries
+        if feed.outcomes.get(e.link) and e.published.timestamp() < blocked
+    ]
+    feed_state = state.setdefault(feed_url, {})
+    if done:
+        feed_state["ts"] = max(feed_state.get("ts", 0.0), *done)
+    if len(feed.outcomes) < len(feed.entries):
+        return
+    del pending[feed_url]
+    if not all(feed.outcomes.values()):
+        logger.info("Not caching validators of feed %s: some articles failed", feed_url)
+        return
+    feed_state.update(feed.validators)
+
+
+def _summarise_entry(
+    entry: FeedEntry, text: str, summary_dir: Path
+) -> Optional[Tuple[str, Path]]:
+    """Summarise an article and write the summary next to its future audio.
+
+    :param entry: The feed entry being processed.
+    :param text: Article text downloaded for the entry.
     :param summary_dir: Directory where output files will be saved.
-    :param tts_fn: TTS function obtained via `get_tts_engine`.
-    :param feed_url: URL of the feed (used for state updates).
-    :param state: Mutable state mapping to update with latest timestamps.
-    :returns: The published timestamp of the processed entry or None if skipped.
+    :returns: The summary and the path its audio should be written to, or
+        None if the summary could not be saved.
     """
     logger.info("Processing article: %s", entry.title)
-    text = fetch_article_text(entry.link)
-    if not text:
-        logger.warning("Skipping article (no text extracted): %s", entry.link)
-        return None
     summary = summarise(text, max_sentences=MAX_SUMMARY_SENTENCES)
     # Compose file names: slugify title for file naming
     safe_title = re.sub(r"[^a-zA-Z0-9_-]", "_", entry.title)[:50]
@@ -106,14 +258,251 @@ def _process_entry(
     try:
         summary_dir.mkdir(parents=True, exist_ok=True)
         txt_path.write_text(summary, encoding="utf-8")
-        # Generate audio
-        tts_fn(summary, str(mp3_path), lang=TTS_LANGUAGE)
     except Exception as exc:
         logger.error("Failed to process article %s: %s", entry.link, exc)
         return None
-    # Update state for this feed
-    state[feed_url] = max(state.get(feed_url, 0.0), entry.published.timestamp())
-    return entry.published.timestamp()
+    return summary, mp3_path
+
+
+def _select_new_entries(
+    feed_url: str, entries: List[FeedEntry], state: Dict[str, Dict[str, Any]]
+) -> List[FeedEntry]:
+    """Return the entries of a feed published since the last run.
+
+    :param feed_url: URL of the feed.
+    :param entries: Parsed entries of the feed, newest first.
+    :param state: Mapping of feed URL to feed state.
+    :returns: New entries, limited to `MAX_ARTICLES_PER_FEED`.
+    """
+    # Determine cutoff timestamp
+    last_ts = state.get(feed_url, {}).get("ts", 0.0)
+    new_entries: List[FeedEntry] = []
+    for entry in entries:
+        if entry.published.timestamp() > last_ts:
+            new_entries.append(entry)
+    logger.info("Found %d new articles in feed %s", len(new_entries), feed_url)
+    # Limit number of articles per feed
+    if MAX_ARTICLES_PER_FEED is not None:
+        new_entries = new_entries[:MAX_ARTICLES_PER_FEED]
+    return new_entries
+
+
+async def _fetch_worker(session, fetch_q: asyncio.Queue, sum_q: asyncio.Queue) -> None:
+    """Pipeline stage 1: download article text for queued entries.
+
+    :param session: Session yielded by `open_session`.
+    :param fetch_q: Queue of (feed URL, entry) tuples; None stops the worker.
+    :param sum_q: Queue receiving (feed URL, entry, article text or None).
+    """
+    while True:
+        item = await fetch_q.get()
+        if item is None:
+            return
+        feed_url, entry = item
+        text = await fetch_article(session, entry.link)
+        await sum_q.put((feed_url, entry, text))
+
+
+async def _summarise_worker(
+    sum_q: asyncio.Queue,
+    tts_q: asyncio.Queue,
+    cpu_pool: ThreadPoolExecutor,
+    summary_dir: Path,
+    state: Dict[str, Dict[str, Any]],
+    pending: Dict[str, _PendingFeed],
+    seen,
+    claimed: Set[str],
+) -> None:
+    """Pipeline stage 2: deduplicate by text and summarise articles.
+
+    An article whose text duplicates one processed earlier is recorded as
+    done, so its link is not fetched again on later runs.  Summarisation is
+    CPU bound and runs in `cpu_pool` so the event loop keeps serving
+    downloads and TTS calls in the meantime.
+
+    :param sum_q: Queue filled by `_fetch_worker`; None stops the worker.
+    :param tts_q: Queue receiving (feed URL, entry, digests, summary, MP3 path).
+    :param cpu_pool: Executor that runs `_summarise_entry`.
+    :param summary_dir: Directory where output files will be saved.
+    :param state: Mapping of feed URL to feed state; updated in place.
+    :param pending: Feeds with outstanding entries; updated in place.
+    :param seen: Filter of processed hashes; updated in place.
+    :param claimed: Hashes reserved during this run; updated in place.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await sum_q.get()
+        if item is None:
+            return
+        feed_url, entry, text = item
+        if not text:
+            logger.warning("Skipping article (no text extracted): %s", entry.link)
+            _entry_done(feed_url, entry, False, state, pending)
+            continue
+        # Catch the same story published under different URLs
+        text_digest = _digest(" ".join(text.split()))
+        if not _claim(text_digest, seen, claimed):
+            logger.info("Skipping duplicate article text: %s", entry.link)
+            seen.add(_digest(entry.link))
+            _entry_done(feed_url, entry, True, state, pending)
+            _checkpoint(state, STATE_FILE)
+            _save_seen(seen, SEEN_FILE)
+            continue
+        try:
+            result = await loop.run_in_executor(
+                cpu_pool, _summarise_entry, entry, text, summary_dir
+            )
+        except Exception as exc:
+            logger.error("Failed to summarise article %s: %s", entry.link, exc)
+            _entry_done(feed_url, entry, False, state, pending)
+            continue
+        if result is None:
+            _entry_done(feed_url, entry, False, state, pending)
+            continue
+        summary, mp3_path = result
+        digests = [_digest(entry.link), text_digest]
+        await tts_q.put((feed_url, entry, digests, summary, mp3_path))
+
+
+async def _tts_worker(
+    tts_q: asyncio.Queue,
+    io_pool: ThreadPoolExecutor,
+    tts_fn,
+    state: Dict[str, Dict[str, Any]],
+    pending: Dict[str, _PendingFeed],
+    seen,
+) -> None:
+    """Pipeline stage 3: synthesise speech and record finished articles.
+
+    After each successful synthesis the article's hashes are added to
+    `seen`, the feed state is advanced as far as `_entry_done` allows, and
+    both are checkpointed.
+
+    :param tts_q: Queue filled by `_summarise_worker`; None stops the worker.
+    :param io_pool: Executor that runs the blocking TTS calls.
+    :param tts_fn: TTS function obtained via `get_tts_engine`.
+    :param state: Mapping of feed URL to feed state; updated in place.
+    :param pending: Feeds with outstanding entries; updated in place.
+    :param seen: Filter of processed hashes; updated in place.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await tts_q.get()
+        if item is None:
+            return
+        feed_url, entry, digests, summary, mp3_path = item
+        try:
+            await loop.run_in_executor(io_pool, tts_fn, summary, str(mp3_path), TTS_LANGUAGE)
+        except Exception as exc:
+            logger.error("Failed to process article %s: %s", entry.link, exc)
+            _entry_done(feed_url, entry, False, state, pending)
+            continue
+        for digest in digests:
+            seen.add(digest)
+        _entry_done(feed_url, entry, True, state, pending)
+        _checkpoint(state, STATE_FILE)
+        _save_seen(seen, SEEN_FILE)
+
+
+async def _fetch_feed_entries(
+    session, feed_url: str, state: Dict[str, Dict[str, Any]]
+) -> Tuple[str, List[FeedEntry], Dict[str, str]]:
+    """Fetch a feed conditionally using the validators stored in `state`.
+
+    The validators returned by the server are not written to `state`; they
+    are returned so the caller can commit them once the feed's articles have
+    been processed.  Errors are logged and leave the feed without entries
+    for this run.
+
+    :param session: Session yielded by `open_session`.
+    :param feed_url: URL of the feed.
+    :param state: Mapping of feed URL to feed state; not modified.
+    :returns: The feed URL, its parsed entries and its current validators.
+    """
+    feed_state = dict(state.get(feed_url, {}))
+    try:
+        entries = await fetch_feed(session, feed_url, feed_state, MAX_ARTICLES_PER_FEED)
+    except Exception as exc:
+        # One broken feed must not abort the run for all the others
+        logger.error("Failed to fetch feed %s: %s", feed_url, exc)
+        return feed_url, [], {}
+    validators = {key: feed_state[key] for key in ("etag", "modified") if key in feed_state}
+    return feed_url, entries, validators
+
+
+async def run_once_async() -> None:
+    """Run the entire pipeline once on the current event loop.
+
+    Articles flow through three stages connected by queues: download
+    (`_FETCH_WORKERS` concurrent workers), summarisation (one worker running
+    in a thread) and speech synthesis (`_TTS_WORKERS` workers).  New entries
+    are queued as soon as their feed has been parsed, so all stages work at
+    the same time and the run takes roughly as long as its slowest stage.
+    """
+    logger.info("AI Podcast Producer run started")
+    state = _load_state(STATE_FILE)
+    seen = _load_seen(SEEN_FILE)
+    claimed: Set[str] = set()
+    pending: Dict[str, _PendingFeed] = {}
+    tts_fn = get_tts_engine(TTS_ENGINE)
+    today_dir = OUTPUT_DIR / datetime.datetime.now().strftime("%Y-%m-%d")
+    fetch_q: asyncio.Queue = asyncio.Queue()
+    sum_q: asyncio.Queue = asyncio.Queue()
+    tts_q: asyncio.Queue = asyncio.Queue()
+    # The summariser is pure Python and holds the GIL, so a single thread is
+    # enough to keep it off the event loop
+    with ThreadPoolExecutor(max_workers=1) as cpu_pool, ThreadPoolExecutor(
+        max_workers=_TTS_WORKERS
+    ) as io_pool:
+        async with open_session() as session:
+            fetchers = [
+                asyncio.create_task(_fetch_worker(session, fetch_q, sum_q))
+                for _ in range(_FETCH_WORKERS)
+            ]
+            summariser = asyncio.create_task(
+                _summarise_worker(
+                    sum_q, tts_q, cpu_pool, today_dir, state, pending, seen, claimed
+                )
+            )
+            synthesisers = [
+                asyncio.create_task(_tts_worker(tts_q, io_pool, tts_fn, state, pending, seen))
+                for _ in range(_TTS_WORKERS)
+            ]
+
+            logger.info("Fetching %d feeds", len(FEED_URLS))
+            for next_feed in asyncio.as_completed(
+                [_fetch_feed_entries(session, url, state) for url in FEED_URLS]
+            ):
+                feed_url, entries, validators = await next_feed
+                if not entries:
+                    logger.info("No new entries in feed %s", feed_url)
+                    continue
+                queued: List[FeedEntry] = []
+                for entry in _select_new_entries(feed_url, entries, state):
+                    if not _claim(_digest(entry.link), seen, claimed):
+                        logger.info("Skipping duplicate article: %s", entry.link)
+                        continue
+                    queued.append(entry)
+                if not queued:
+                    # Nothing left to retry, so the validators can be kept
+                    state.setdefault(feed_url, {}).update(validators)
+                    continue
+                pending[feed_url] = _PendingFeed(validators, queued)
+                for entry in queued:
+                    await fetch_q.put((feed_url, entry))
+
+            # Shut the stages down in order once each has drained its queue
+            for _ in fetchers:
+                await fetch_q.put(None)
+            await asyncio.gather(*fetchers)
+            await sum_q.put(None)
+            await summariser
+            for _ in synthesisers:
+                await tts_q.put(None)
+            await asyncio.gather(*synthesisers)
+    _checkpoint(state, STATE_FILE)
+    _save_seen(seen, SEEN_FILE)
+    logger.info("AI Podcast Producer run completed")
 
 
 def run_once() -> None:
@@ -124,42 +513,26 @@ def run_once() -> None:
     publication dates to avoid processing the same articles again.  Errors
     are logged but do not stop the processing of other feeds.
     """
-    logger.info("AI Podcast Producer run started")
-    state = _load_state(STATE_FILE)
-    tts_fn = get_tts_engine(TTS_ENGINE)
-    today_dir = OUTPUT_DIR / datetime.datetime.now().strftime("%Y-%m-%d")
-    for feed_url in FEED_URLS:
-        logger.info("Fetching feed %s", feed_url)
-        entries = parse_rss_feed(feed_url)
-        if not entries:
-            logger.warning("No entries parsed from feed %s", feed_url)
-            continue
-        # Determine cutoff timestamp
-        last_ts = state.get(feed_url, 0.0)
-        new_entries: List[FeedEntry] = []
-        for entry in entries:
-            if entry.published.timestamp() > last_ts:
-                new_entries.append(entry)
-        logger.info("Found %d new articles in feed %s", len(new_entries), feed_url)
-        # Limit number of articles per feed
-        if MAX_ARTICLES_PER_FEED is not None:
-            new_entries = new_entries[:MAX_ARTICLES_PER_FEED]
-        for entry in new_entries:
-            _process_entry(entry, today_dir, tts_fn, feed_url, state)
-    _save_state(state, STATE_FILE)
-    logger.info("AI Podcast Producer run completed")
+    asyncio.run(run_once_async())
 
 
-def schedule_run() -> None:
-    """Schedule the pipeline to run periodically.
+async def schedule_run_async() -> None:
+    """Run the pipeline periodically on the current event loop.
 
-    Uses the `schedule` library to run `run_once` every
-    `RUN_EVERY_MINUTES`.  This function blocks indefinitely.
+    The pipeline runs immediately and then every `RUN_EVERY_MINUTES`,
+    measured from the start of each run; if a run takes longer than the
+    interval the next one starts as soon as it finishes.  The process sleeps
+    between runs instead of polling.  This coroutine never returns.
     """
     logger.info("Scheduling AI Podcast Producer every %d minutes", RUN_EVERY_MINUTES)
-    schedule.every(RUN_EVERY_MINUTES).minutes.do(run_once)
-    # Run immediately once at start
-    run_once()
     while True:
-        schedule.run_pending()
-        time.sleep(1)
\ No newline at end of file
+        await asyncio.gather(run_once_async(), asyncio.sleep(RUN_EVERY_MINUTES * 60))
+
+
+def schedule_run() -> None:
+    """Schedule the pipeline to run periodically.
+
+    Runs `schedule_run_async` on a new event loop to execute the pipeline
+    every `RUN_EVERY_MINUTES`.  This function blocks indefinitely.
+    """
+    asyncio.run(schedule_run_async())
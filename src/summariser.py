@@ -5,7 +5,8 @@ the most informative sentences from an article.  It does not require
 third‑party machine learning libraries and runs on the standard Python
 library.  The algorithm follows these steps:
 
-1. Tokenise the article into sentences.
+1. Tokenise the article into sentences (with `pysbd` when installed, which
+   handles abbreviations such as "Dr." and "U.S." correctly).
 2. Tokenise sentences into words, remove stop words and punctuation and
    compute word frequencies.
 3. Score each sentence by summing the frequencies of its words.
@@ -17,17 +18,49 @@ is returned.
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
+from collections import Counter
+from itertools import chain
 from typing import List, Sequence, Tuple
 
+try:
+    import pysbd  # type: ignore
+except ImportError:
+    pysbd = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Rule‑based sentence segmenter; created once since building it compiles
+# its rule set.
+_SEG = pysbd.Segmenter(language="en", clean=False) if pysbd else None
+
+# pysbd's cost grows much faster than linearly with the length of its input,
+# so it is run per paragraph, and longer paragraphs are fed to it in chunks of
+# about this many characters.
+_PYSBD_MAX_CHARS = 2000
+
+# A line break after sentence‑ending punctuation separates two paragraphs;
+# other line breaks are treated as ordinary whitespace.
+_PARAGRAPH_BREAK_RE = re.compile(r"(?<=[.!?\"'\u201d\u2019)])[ \t]*\n\s*")
+
+# Texts shorter than this many characters are returned without scoring.
+_SHORT_TEXT_CHARS = 300
+
+# Matches a single word: a run of letters, optionally containing apostrophes.
+_TOKEN_RE = re.compile(r"\b[a-zA-Z']+\b")
+
+# Runs of whitespace, collapsed to a single space before splitting.
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Punctuation followed by whitespace and a capital letter marks a sentence end.
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
 
 # A basic set of common English stop words.  Extend this list if you wish
 # to filter out additional low‑information words.  Avoid duplicates to
 # improve performance.
-STOP_WORDS = set(
+STOP_WORDS = frozenset(
     [
         "a",
         "an",
@@ -99,21 +132,73 @@ STOP_WORDS = set(
 
 
 def _split_sentences(text: str) -> List[str]:
-    """Split a block of text into sentences using a regular expression.
+    """Split a block of text into sentences.
+
+    When `pysbd` is installed its rule‑based segmenter is used, which copes
+    with abbreviations and initials.  It is applied to one paragraph at a
+    time, since its running time grows quickly with the length of its input
+    (see `_segment`).  Otherwise a regular expression looks for punctuation
+    that typically signals the end of a sentence (periods, question marks,
+    exclamation marks) followed by whitespace and an uppercase letter.  This
+    heuristic works well for English prose but may not handle abbreviations
+    perfectly.
+
+    :param text: Raw article text.
+    :returns: List of sentence strings.
+    """
+    if _SEG is None:
+        return _split_with_regex(text)
+    sentences: List[str] = []
+    for paragraph in _PARAGRAPH_BREAK_RE.split(text.strip()):
+        # Normalise whitespace; pysbd would treat remaining line breaks as
+        # sentence ends
+        paragraph = _WHITESPACE_RE.sub(" ", paragraph.strip())
+        if not paragraph:
+            continue
+        sentences.extend(_segment(paragraph))
+    return sentences
+
+
+def _segment(paragraph: str) -> List[str]:
+    """Split one paragraph into sentences with pysbd.
+
+    Paragraphs longer than `_PYSBD_MAX_CHARS` are cut into chunks of about
+    that size at the boundaries found by `_SENTENCE_END_RE`, and each chunk
+    is segmented on its own.  Since such a boundary may be wrong (after
+    "Dr." for instance), the last sentence pysbd finds in a chunk is carried
+    over to the start of the next one and segmented again.
 
-    The regex looks for punctuation that typically signals the end of a
-    sentence (periods, question marks, exclamation marks) followed by
-    whitespace and an uppercase letter.  This heuristic works well for
-    English prose but may not handle abbreviations perfectly.
+    :param paragraph: Paragraph with normalised whitespace.
+    :returns: List of sentence strings.
+    """
+    if len(paragraph) <= _PYSBD_MAX_CHARS:
+        return [s.strip() for s in _SEG.segment(paragraph) if s.strip()]
+    sentences: List[str] = []
+    chunk = ""
+    for piece in _SENTENCE_END_RE.split(paragraph):
+        if chunk and len(chunk) + len(piece) >= _PYSBD_MAX_CHARS:
+            segmented = [s.strip() for s in _SEG.segment(chunk) if s.strip()]
+            chunk = ""
+            # Carry the possibly incomplete last sentence over, unless it is
+            # so long that the chunks would keep growing
+            if segmented and len(segmented[-1]) < _PYSBD_MAX_CHARS // 2:
+                chunk = segmented.pop()
+            sentences.extend(segmented)
+        chunk = f"{chunk} {piece}" if chunk else piece
+    if chunk:
+        sentences.extend(s.strip() for s in _SEG.segment(chunk) if s.strip())
+    return sentences
+
+
+def _split_with_regex(text: str) -> List[str]:
+    """Split text at punctuation followed by space and a capital letter.
 
     :param text: Raw article text.
     :returns: List of sentence strings.
     """
     # Normalise whitespace
-    text = re.sub(r"\s+", " ", text.strip())
-    # Use lookbehind to split at punctuation followed by space and capital letter
-    sentence_endings = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
-    sentences = sentence_endings.split(text)
+    text = _WHITESPACE_RE.sub(" ", text.strip())
+    sentences = _SENTENCE_END_RE.split(text)
     # Remove any empty sentences
     return [s.strip() for s in sentences if s.strip()]
 
@@ -125,8 +210,26 @@ def _tokenise(sentence: str) -> List[str]:
     :returns: List of cleaned word tokens.
     """
     # Remove non‑alphabetic characters and split on whitespace
-    words = re.findall(r"\b[a-zA-Z']+\b", sentence.lower())
-    return words
+    return _TOKEN_RE.findall(sentence.lower())
+
+
+def _score_sentences(
+    tokens_per_sentence: Sequence[List[str]], lengths: Sequence[int], freq: Counter
+) -> List[float]:
+    """Score sentences by the summed frequency of their words.
+
+    Stop words have no frequency, so only the remaining words are summed;
+    the total is divided by the full word count of the sentence.
+
+    :param tokens_per_sentence: Non‑stop‑word tokens of each sentence.
+    :param lengths: Number of words in each sentence, stop words included.
+    :param freq: Frequency of each non‑stop word across the article.
+    :returns: Score of each sentence, in order; 0.0 for empty sentences.
+    """
+    return [
+        sum(freq[w] for w in words) / length if length else 0.0
+        for words, length in zip(tokens_per_sentence, lengths)
+    ]
 
 
 def summarise(text: str, max_sentences: int = 5) -> str:
@@ -136,36 +239,43 @@ def summarise(text: str, max_sentences: int = 5) -> str:
     original text is returned unchanged.  Otherwise the top‐scoring sentences
     are selected based on word frequency.
 
+    Very short texts, and texts with too few sentence‑ending punctuation
+    marks to hold more than `max_sentences` sentences, are returned as is
+    without being split or tokenised.
+
     :param text: Full article text.
     :param max_sentences: Maximum number of sentences to include in the summary.
     :returns: A concise summary.
     """
+    if len(text) < _SHORT_TEXT_CHARS or sum(map(text.count, ".!?")) < max_sentences:
+        return text.strip()
+
     sentences = _split_sentences(text)
     logger.debug("Article split into %d sentences", len(sentences))
     if len(sentences) <= max_sentences:
         return " ".join(sentences)
 
-    # Compute word frequencies excluding stop words
-    freq: dict[str, int] = {}
+    # Tokenise each sentence once and drop stop words straight away; only the
+    # full word count is kept, since scores are normalised by it
+    tokens_per_sentence: List[List[str]] = []
+    lengths: List[int] = []
     for sentence in sentences:
-        for word in _tokenise(sentence):
-            if word in STOP_WORDS:
-                continue
-            freq[word] = freq.get(word, 0) + 1
+        words = _tokenise(sentence)
+        lengths.append(len(words))
+        tokens_per_sentence.append([w for w in words if w not in STOP_WORDS])
+
+    # Compute word frequencies; chaining the token lists keeps the whole count
+    # inside Counter's C loop
+    freq = Counter(chain.from_iterable(tokens_per_sentence))
 
     # Score sentences: sum of word frequencies normalised by sentence length
-    scores: List[Tuple[int, float]] = []
-    for idx, sentence in enumerate(sentences):
-        words = _tokenise(sentence)
-        if not words:
-            scores.append((idx, 0.0))
-            continue
-        score = sum(freq.get(w, 0) for w in words) / len(words)
-        scores.append((idx, score))
+    scores: List[Tuple[int, float]] = list(
+        enumerate(_score_sentences(tokens_per_sentence, lengths, freq))
+    )
 
     # Select the top N sentences by score
-    # Sorting by score descending, then by index ascending to favour earlier sentences
-    top_indices = sorted(scores, key=lambda x: (-x[1], x[0]))[:max_sentences]
+    # Highest score first, then lowest index to favour earlier sentences
+    top_indices = heapq.nlargest(max_sentences, scores, key=lambda x: (x[1], -x[0]))
     # Restore original order
     top_indices_sorted = sorted(idx for idx, _ in top_indices)
     summary = " ".join(sentences[i] for i in top_indices_sorted)
@@ -5,20 +5,53 @@ default implementation relies on the `gTTS` library, which sends a request
 to Google Translate to synthesise speech.  If `gTTS` is unavailable or if
 you prefer to run offline, you can implement your own function with the
 same signature and configure it via `config.TTS_ENGINE`.
+
+Audio produced by gTTS is cached by the SHA‑256 of the text and language, so
+repeated summaries are linked from the cache instead of being synthesised
+again.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
+from config import OUTPUT_DIR
+
 logger = logging.getLogger(__name__)
 
+# Content‑addressed store of previously synthesised MP3 files.
+_TTS_CACHE_DIR = OUTPUT_DIR / ".tts_cache"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Make `dst` a hard link to `src`, copying if linking is not possible.
+
+    :param src: Existing file.
+    :param dst: Destination path; replaced if it already exists.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
 
 def gtts_synthesise(text: str, filename: str, lang: str = "en") -> None:
     """Generate speech using the gTTS library and save it to an MP3 file.
 
+    Results are cached under `OUTPUT_DIR/.tts_cache`; when the same text and
+    language were synthesised before, the cached file is hard linked (or
+    copied) to `filename` and no request is made.
+
     :param text: Text to speak.
     :param filename: Path to the output MP3 file.
     :param lang: Language code (default: 'en').
@@ -30,12 +63,27 @@ def gtts_synthesise(text: str, filename: str, lang: str = "en") -> None:
         raise RuntimeError(
             "gTTS is not installed.  Install it via 'pip install gTTS' or select a different TTS engine."
         )
-    # Ensure output directory exists
     out_path = Path(filename)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    logger.debug("Synthesising speech to %s", out_path)
-    tts = gTTS(text=text, lang=lang)
-    tts.save(str(out_path))
+    digest = hashlib.sha256((text + lang).encode("utf-8")).hexdigest()
+    cache_path = _TTS_CACHE_DIR / f"{digest}.mp3"
+    if cache_path.exists():
+        logger.debug("Reusing cached speech %s for %s", cache_path, out_path)
+        _link_or_copy(cache_path, out_path)
+        return
+    # Synthesise into a temporary file so concurrent calls never see a
+    # partially written cache entry
+    _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(suffix=".mp3.tmp", dir=_TTS_CACHE_DIR)
+    os.close(fd)
+    try:
+        logger.debug("Synthesising speech to %s", out_path)
+        tts = gTTS(text=text, lang=lang)
+        tts.save(tmp_name)
+        os.replace(tmp_name, cache_path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+    _link_or_copy(cache_path, out_path)
 
 
 def noop_synthesise(text: str, filename: str, lang: str = "en") -> None:
@@ -60,21 +108,27 @@ def noop_synthesise(text: str, filename: str, lang: str = "en") -> None:
     out_path.write_text(text, encoding="utf-8")
 
 
+# Registry of available TTS engines, keyed by the names accepted in
+# `config.TTS_ENGINE`.
+_ENGINES = {
+    "gtts_synthesise": gtts_synthesise,
+    "noop_synthesise": noop_synthesise,
+}
+
+
+@lru_cache(maxsize=None)
 def get_tts_engine(name: str) -> Callable[[str, str, str], None]:
     """Return a TTS function by name.
 
     The function should accept three positional arguments (text, filename,
     language).  If the requested engine is unknown, the `noop_synthesise`
-    function is returned.
+    function is returned.  Lookups are cached, so the warning for an unknown
+    engine is only logged once.
 
     :param name: Name of the TTS engine as configured in `config.TTS_ENGINE`.
     :returns: A callable for synthesising speech.
     """
-    engines = {
-        "gtts_synthesise": gtts_synthesise,
-        "noop_synthesise": noop_synthesise,
-    }
-    engine = engines.get(name)
+    engine = _ENGINES.get(name)
     if engine is None:
         logger.warning("Unknown TTS engine '%s'; falling back to noop_synthesise", name)
         return noop_synthesise